@@ -17,20 +17,381 @@ Architecture Flow:
 Frontend (React) → API Gateway → Lambda Function → Response → API Gateway → Frontend
 """
 
-import json
-import boto3
-from datetime import datetime
-import uuid
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from secrets import token_hex
+
+# Every log line is a synchronous write to CloudWatch, so per-request messages
+# are DEBUG and the default level is WARNING. Messages use %-style arguments,
+# which are only formatted when the level is actually enabled.
+logger = logging.getLogger()
+_log_level = os.environ.get('LOG_LEVEL', 'WARNING').upper()
+if _log_level not in logging.getLevelNamesMapping():
+    _log_level = 'WARNING'  # A typo in LOG_LEVEL mustn't break every cold start
+logger.setLevel(_log_level)
+
+# The root level is inherited by library loggers too - at DEBUG, botocore
+# and urllib3 would log every DynamoDB request on the wire
+for _library in ('boto3', 'botocore', 'urllib3'):
+    logging.getLogger(_library).setLevel(logging.WARNING)
 
 # ==============================================================================
-# GLOBAL STORAGE (In-Memory)
+# ITEM MODEL
 # ==============================================================================
-# NOTE: This is for demonstration only!
-# In production, use AWS DynamoDB for persistent storage
+# Items kept in a warm container are slotted dataclasses rather than dicts:
+# no per-instance __dict__, so each one takes a fraction of the memory.
+# orjson serializes them natively - no conversion pass before responding.
+# Only the in-memory backend uses Item. DynamoDB records are passed through
+# as raw attribute dicts: another writer may store attributes Item doesn't
+# declare (or omit some), and that mustn't turn a read into a 500.
+@dataclass(slots=True)
+class Item:
+    id: str
+    name: str
+    description: str
+    category: str
+    price: float
+    created_at: str
+    updated_at: str
+
+def _json_default(obj):
+    """Serialize what orjson/json can't handle on their own"""
+    # DynamoDB returns every number as Decimal - serialize them as int/float
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    # Only reached by the stdlib json fallback; orjson handles dataclasses
+    if isinstance(obj, Item):
+        return asdict(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+# orjson is a C extension that serializes several times faster than the
+# stdlib json module. It ships in the deployment package (requirements.txt);
+# if it's missing, fall back to json so the function still runs
+try:
+    import orjson
+
+    def _body(obj):
+        """Serialize a response body to the str API Gateway expects"""
+        return orjson.dumps(obj, default=_json_default).decode()
+
+    _loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+    
+    # Usually a missing package or a wheel built for another Python
+    # version/architecture - everything still works, just slower
+    logger.warning("⚠️ orjson not importable, falling back to stdlib json")
+
+    def _body(obj):
+        """Serialize a response body to the str API Gateway expects"""
+        return json.dumps(obj, default=_json_default)
+
+    _loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+# ==============================================================================
+# STORAGE (DynamoDB, or In-Memory fallback)
+# ==============================================================================
+# Lambda containers are ephemeral and NOT shared between concurrent
+# invocations, so anything kept in memory is lost on scale-out or recycle.
+# Set the ITEMS_TABLE environment variable to persist items in DynamoDB
+# (see AWS_SETUP_GUIDE.md for the table layout).
+#
+# The table handle is created here, at cold start, and reused by every warm
+# invocation - never build boto3 clients inside the handler. boto3 itself is
+# only imported when a table is configured: importing it adds hundreds of
+# milliseconds to every cold start.
+ITEMS_TABLE = os.environ.get('ITEMS_TABLE')
+
+if ITEMS_TABLE:
+    import boto3
+    from boto3.dynamodb.conditions import Key
+    from botocore.config import Config
+    
+    # Keep-alive reuses the TCP+TLS connection across warm invocations, so
+    # only the first call in a container pays the handshake. Short timeouts
+    # and few retries keep a slow DynamoDB call well inside the API Gateway
+    # 30s limit.
+    _boto_config = Config(
+        tcp_keepalive=True,
+        max_pool_connections=10,
+        retries={'max_attempts': 2, 'mode': 'standard'},
+        connect_timeout=1,
+        read_timeout=3
+    )
+    _ddb = boto3.resource(
+        'dynamodb',
+        region_name=os.environ.get('AWS_REGION'),
+        config=_boto_config
+    )
+    _table = _ddb.Table(ITEMS_TABLE)
+    
+    # Reads are served from these per-container caches when possible,
+    # saving a DynamoDB round trip. Writes invalidate them in this container
+    # only - other warm containers may serve a stale item for up to 30s
+    # (lists for up to 10s), which is acceptable for this API.
+    from cachetools import TTLCache
+    
+    _item_cache = TTLCache(maxsize=1024, ttl=30)
+    _list_cache = TTLCache(maxsize=64, ttl=10)
+else:
+    _table = None
+
+# NOTE: The in-memory dict is for demonstration only!
 # Lambda containers are reused for efficiency, so this dict persists
 # between invocations for a short time, but it's NOT guaranteed
 items_storage = {}
 
+# Secondary index so ?category= lookups touch only matching items:
+# category → {item_id: item}, plus each item's currently indexed category
+# (update_item edits items in place, so the old category can't be read back
+# off the item itself)
+items_by_category = {}
+item_categories = {}
+
+def _to_dynamo_value(value):
+    """DynamoDB rejects Python floats at any depth - store them as Decimal"""
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: _to_dynamo_value(inner) for key, inner in value.items()}
+    if isinstance(value, list):
+        return [_to_dynamo_value(inner) for inner in value]
+    return value
+
+def _to_dynamo(item):
+    """Item → DynamoDB attributes"""
+    return {key: _to_dynamo_value(value) for key, value in asdict(item).items()}
+
+def _unindex(category, item_id):
+    """Drop an item from the in-memory category index"""
+    bucket = items_by_category[category]
+    del bucket[item_id]
+    if not bucket:
+        del items_by_category[category]
+
+def get_item(item_id):
+    """Return the stored item (attribute dict with DynamoDB), or None if it doesn't exist"""
+    # '/items/' yields an empty ID, which DynamoDB rejects as a key - it can
+    # never match an item, so answer without a table call
+    if not item_id:
+        return None
+    if _table is None:
+        return items_storage.get(item_id)
+    
+    item = _item_cache.get(item_id)
+    if item is None:
+        item = _table.get_item(Key={'id': item_id}).get('Item')
+        if item is None:
+            return None
+        _item_cache[item_id] = item
+    return item
+
+def put_item(item):
+    """Create or replace an item"""
+    if _table is None:
+        item_id = item.id
+        category = item.category
+        old_category = item_categories.get(item_id, category)
+        if old_category != category:
+            _unindex(old_category, item_id)
+        items_storage[item_id] = item
+        item_categories[item_id] = category
+        items_by_category.setdefault(category, {})[item_id] = item
+    else:
+        _item_cache.pop(item.id, None)
+        _list_cache.clear()
+        _table.put_item(Item=_to_dynamo(item))
+
+def update_item(item_id, changes, updated_at):
+    """
+    Set the given fields and updated_at on an existing item.
+    
+    Returns the updated item (attribute dict with DynamoDB), or None if it
+    doesn't exist. With DynamoDB this is one conditional UpdateItem rather
+    than a read-modify-write: the cached copy may be stale or already
+    deleted by another container, and writing it back would revert or
+    resurrect the item.
+    """
+    if not item_id:
+        return None
+    if _table is None:
+        item = items_storage.get(item_id)
+        if item is None:
+            return None
+        for field, value in changes.items():
+            setattr(item, field, value)
+        item.updated_at = updated_at
+        put_item(item)  # Re-indexes the category if it changed
+        return item
+    
+    # Attribute names go through placeholders - 'name' is a reserved word
+    names = {'#id': 'id', '#updated_at': 'updated_at'}
+    values = {':updated_at': updated_at}
+    assignments = ['#updated_at = :updated_at']
+    for field, value in changes.items():
+        names[f'#{field}'] = field
+        values[f':{field}'] = _to_dynamo_value(value)
+        assignments.append(f'#{field} = :{field}')
+    
+    _item_cache.pop(item_id, None)
+    _list_cache.clear()
+    try:
+        return _table.update_item(
+            Key={'id': item_id},
+            UpdateExpression='SET ' + ', '.join(assignments),
+            ConditionExpression='attribute_exists(#id)',
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ReturnValues='ALL_NEW'
+        )['Attributes']
+    except _table.meta.client.exceptions.ConditionalCheckFailedException:
+        return None
+
+def delete_item(item_id):
+    """Delete an item and return it (attribute dict with DynamoDB), or None if it didn't exist"""
+    if not item_id:
+        return None
+    if _table is None:
+        item = items_storage.pop(item_id, None)
+        if item is not None:
+            _unindex(item_categories.pop(item_id), item_id)
+        return item
+    
+    _item_cache.pop(item_id, None)
+    _list_cache.clear()
+    return _table.delete_item(Key={'id': item_id}, ReturnValues='ALL_OLD').get('Attributes')
+
+def list_items(category=None):
+    """
+    Return all items, optionally only those in one category.
+    
+    With DynamoDB the category filter runs server-side on the
+    'category-index' GSI, so no items are scanned in Python, and the raw
+    'Items' lists are returned as-is for _body() to serialize - those
+    are plain dicts, while the in-memory backend returns Item instances.
+    """
+    if _table is None:
+        if category:
+            return list(items_by_category.get(category, {}).values())
+        return list(items_storage.values())
+    
+    items = _list_cache.get(category)
+    if items is not None:
+        return items
+    
+    if category:
+        request = _table.query
+        kwargs = {
+            'IndexName': 'category-index',
+            'KeyConditionExpression': Key('category').eq(category),
+            'Select': 'ALL_ATTRIBUTES'
+        }
+    else:
+        request = _table.scan
+        kwargs = {}
+    
+    # Both calls return at most 1MB per page - follow LastEvaluatedKey
+    page = request(**kwargs)
+    items = page['Items']
+    while 'LastEvaluatedKey' in page:
+        kwargs['ExclusiveStartKey'] = page['LastEvaluatedKey']
+        page = request(**kwargs)
+        items.extend(page['Items'])
+    
+    _list_cache[category] = items
+    return items
+
+# ==============================================================================
+# STATIC RESPONSE PARTS (built once per container, at cold start)
+# ==============================================================================
+# Cross-Origin Resource Sharing - allows frontend from different domain
+# to call this API. Essential for React app on localhost to call AWS API
+# Shared by every response, so treat it as read-only: never mutate it in a
+# handler. (A MappingProxyType would enforce that, but the Lambda runtime
+# can't JSON-serialize one back to API Gateway.)
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',  # Allow any domain (dev only!)
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
+}
+
+# Reported by /health - read from the running interpreter so it stays right
+# when the function's runtime is upgraded
+PYTHON_VERSION = f'{sys.version_info.major}.{sys.version_info.minor}'
+
+# Responses whose body never changes are serialized here instead of on
+# every warm invocation
+OPTIONS_RESPONSE = {
+    'statusCode': 200,
+    'headers': CORS_HEADERS,
+    'body': '{"message": "CORS preflight successful"}'
+}
+
+PATH_NOT_FOUND_RESPONSE = {
+    'statusCode': 404,
+    'headers': CORS_HEADERS,
+    'body': '{"error": "Path not found"}'
+}
+
+ITEM_NOT_FOUND_RESPONSE = {
+    'statusCode': 404,
+    'headers': CORS_HEADERS,
+    'body': '{"error": "Item not found"}'
+}
+
+NAME_REQUIRED_RESPONSE = {
+    'statusCode': 400,  # Bad Request
+    'headers': CORS_HEADERS,
+    'body': '{"error": "Name is required", "field": "name"}'
+}
+
+INVALID_JSON_RESPONSE = {
+    'statusCode': 400,  # Bad Request
+    'headers': CORS_HEADERS,
+    'body': '{"error": "Invalid JSON in request body", "tip": "Ensure request Content-Type is application/json"}'
+}
+
+BODY_NOT_OBJECT_RESPONSE = {
+    'statusCode': 400,  # Bad Request
+    'headers': CORS_HEADERS,
+    'body': '{"error": "Request body must be a JSON object"}'
+}
+
+CATEGORY_NOT_STRING_RESPONSE = {
+    'statusCode': 400,  # Bad Request
+    'headers': CORS_HEADERS,
+    'body': '{"error": "Category must be a string", "field": "category"}'
+}
+
+CATEGORY_EMPTY_RESPONSE = {
+    'statusCode': 400,  # Bad Request
+    'headers': CORS_HEADERS,
+    'body': '{"error": "Category must not be empty", "field": "category"}'
+}
+
+# Item fields a PUT may change - id and created_at are never client-writable
+MUTABLE_FIELDS = ('name', 'description', 'category', 'price')
+
+# HTTP methods are plain tokens (no quotes or backslashes), so they can be
+# dropped into the pre-serialized body without escaping
+HEALTH_METHOD_NOT_ALLOWED_BODY = '{"error": "Method %s not allowed for /health", "allowed_methods": ["GET"]}'
+ITEMS_METHOD_NOT_ALLOWED_BODY = '{"error": "Method %s not allowed for /items", "allowed_methods": ["GET", "POST"]}'
+ITEM_METHOD_NOT_ALLOWED_BODY = '{"error": "Method %s not allowed for /items/{id}", "allowed_methods": ["GET", "PUT", "DELETE"]}'
+
+def error_response(status_code, message):
+    """Build an error response for messages not covered by the constants above"""
+    return {
+        'statusCode': status_code,
+        'headers': CORS_HEADERS,
+        'body': _body({'error': message})
+    }
+
 def lambda_handler(event, context):
     """
     Main Lambda Entry Point
@@ -49,6 +410,10 @@ def lambda_handler(event, context):
         - queryStringParameters: URL query params (?category=electronics)
         - pathParameters: URL path variables ({id} in /items/{id})
         
+        HTTP APIs (payload format 2.0) send routeKey ("GET /items/{id}"),
+        requestContext.http.method and rawPath instead of httpMethod/path.
+        Both formats are accepted.
+        
     context : LambdaContext
         Lambda runtime information (request ID, memory limit, etc.)
         Not used in this function but always provided by AWS
@@ -63,65 +428,94 @@ def lambda_handler(event, context):
     """
     
     try:
-        # ======================================================================
-        # REQUEST PARSING
-        # ======================================================================
-        # Extract key information from the API Gateway event
-        http_method = event.get('httpMethod', 'GET')  # Default to GET if missing
-        path = event.get('path', '/')                 # Default to root path
-        
-        print(f"🚀 Processing: {http_method} {path}")  # CloudWatch logging
-        
-        # ======================================================================
-        # CORS HEADERS SETUP
-        # ======================================================================
-        # Cross-Origin Resource Sharing - allows frontend from different domain
-        # to call this API. Essential for React app on localhost to call AWS API
-        cors_headers = {
-            'Access-Control-Allow-Origin': '*',  # Allow any domain (dev only!)
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
-        }
-        
         # ======================================================================
         # CORS PREFLIGHT HANDLING
         # ======================================================================
         # Browsers send OPTIONS request before actual request for CORS check
         # This is automatic browser behavior for "complex" requests
+        # Preflights can be a large share of browser traffic and the answer
+        # never changes, so return the prebuilt response before doing
+        # anything else
+        route_key = event.get('routeKey')  # Only sent by HTTP APIs
+        if route_key is None:
+            http_method = event.get('httpMethod', 'GET')  # Default to GET if missing
+        else:
+            http_method = event['requestContext']['http']['method']
         if http_method == 'OPTIONS':
-            return {
-                'statusCode': 200,
-                'headers': cors_headers,
-                'body': json.dumps({'message': 'CORS preflight successful'})
-            }
+            return OPTIONS_RESPONSE
+        
+        # ======================================================================
+        # REQUEST PARSING
+        # ======================================================================
+        # Extract key information from the API Gateway event
+        if route_key is None:
+            path = event.get('path', '/')             # Default to root path
+        else:
+            path = event.get('rawPath', '/')
+            # On a named stage rawPath starts with it (/prod/items) - strip
+            # it so path-based routing sees the same paths as payload 1.0
+            stage = event['requestContext'].get('stage', '$default')
+            if stage != '$default':
+                stage_prefix = '/' + stage
+                if path == stage_prefix or path.startswith(stage_prefix + '/'):
+                    path = path[len(stage_prefix):] or '/'
+        
+        logger.debug("🚀 Processing: %s %s", http_method, path)
         
         # ======================================================================
         # ROUTING LOGIC
         # ======================================================================
-        # Route requests to appropriate handlers based on URL path
-        # This is like a simple router in web frameworks
+        # HTTP APIs have already matched the request to a declared route -
+        # dispatch on that directly. Unmatched keys ($default or catch-all
+        # routes) fall through to path-based routing below
+        if route_key is not None:
+            handler = HTTP_API_ROUTES.get(route_key)
+            if handler is not None:
+                return handler(event)
+            handler = HTTP_API_ITEM_ROUTES.get(route_key)
+            if handler is not None:
+                return handler(event, event['pathParameters']['id'])
         
-        if path == '/health':
-            # Health check endpoint - useful for monitoring and testing
-            return handle_health(event, cors_headers)
-            
-        elif path == '/items':
-            # Collection endpoint - operates on all items
-            return handle_items(event, http_method, cors_headers)
-            
+        # Route requests with a single dict lookup on (method, path) - see
+        # ROUTES at the bottom of this file. This is like a simple router
+        # in web frameworks
+        handler = ROUTES.get((http_method, path))
+        if handler is not None:
+            return handler(event)
+        
+        # Single resource endpoint - operates on specific item
+        # API Gateway has already parsed {id} out of /items/{id} into
+        # pathParameters; only slice the path ourselves when it's missing
+        # (e.g. hand-written test events)
+        path_params = event.get('pathParameters')
+        if path_params and 'id' in path_params:
+            item_id = path_params['id']
         elif path.startswith('/items/'):
-            # Single resource endpoint - operates on specific item
             # Extract item ID from path: /items/123 → item_id = "123"
-            item_id = path.split('/')[-1]  # Get last part after final slash
-            return handle_single_item(event, http_method, item_id, cors_headers)
-            
+            item_id = path[7:]  # Everything after '/items/'
         else:
-            # 404 - Path not found
+            item_id = None
+        
+        if item_id is not None:
+            handler = ITEM_ROUTES.get(http_method)
+            if handler is None:
+                return {
+                    'statusCode': 405,  # Method Not Allowed
+                    'headers': CORS_HEADERS,
+                    'body': ITEM_METHOD_NOT_ALLOWED_BODY % http_method
+                }
+            return handler(event, item_id)
+        
+        # Known path but unsupported method → 405, otherwise 404
+        method_not_allowed_body = METHOD_NOT_ALLOWED_BODIES.get(path)
+        if method_not_allowed_body is not None:
             return {
-                'statusCode': 404,
-                'headers': cors_headers,
-                'body': json.dumps({'error': 'Path not found'})
+                'statusCode': 405,  # Method Not Allowed
+                'headers': CORS_HEADERS,
+                'body': method_not_allowed_body % http_method
             }
+        
+        return PATH_NOT_FOUND_RESPONSE
             
     except Exception as e:
         # ======================================================================
@@ -129,20 +523,16 @@ def lambda_handler(event, context):
         # ======================================================================
         # Catch any unexpected errors and return 500 Internal Server Error
         # In production, you'd log more details and possibly send alerts
-        print(f"❌ Unexpected error: {str(e)}")  # CloudWatch logging
+        logger.exception("❌ Unexpected error: %s", e)
         
-        return {
-            'statusCode': 500,
-            'headers': cors_headers,
-            'body': json.dumps({'error': str(e)})
-        }
+        return error_response(500, str(e))
 
-def handle_health(event, cors_headers):
+def handle_health(event):
     """
     Health Check Endpoint Handler
     ============================
     
-    Simple endpoint to verify the Lambda function is working.
+    GET /health - Simple endpoint to verify the Lambda function is working.
     Used for:
     - API Gateway testing
     - Monitoring systems
@@ -153,268 +543,259 @@ def handle_health(event, cors_headers):
     """
     return {
         'statusCode': 200,
-        'headers': cors_headers,
-        'body': json.dumps({
+        'headers': CORS_HEADERS,
+        'body': _body({
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
             'message': 'Lambda backend is running successfully!',
-            'python_version': '3.11',
+            'python_version': PYTHON_VERSION,
             'service': 'aws-gateway-backend'
         })
     }
 
-def handle_items(event, http_method, cors_headers):
+# ==============================================================================
+# ITEMS COLLECTION HANDLERS
+# ==============================================================================
+# Operations on the entire collection of items. This follows REST API
+# conventions:
+# - Collection URLs (without ID) operate on multiple resources
+# - Use appropriate HTTP methods for different operations
+
+def handle_list_items(event):
+    """
+    GET /items - Retrieve All Items
+    ==============================
+    
+    Optional query parameter filtering: /items?category=electronics
     """
-    Items Collection Handler
-    =======================
+    query_params = event.get('queryStringParameters') or {}
+    category_filter = query_params.get('category')
     
-    Handles operations on the entire collection of items:
-    - GET /items: Retrieve all items (with optional filtering)
-    - POST /items: Create a new item
+    # Fetch items from storage, applying category filter if provided
+    filtered_items = list_items(category_filter)
+    total = len(filtered_items)
     
-    This follows REST API conventions:
-    - Collection URLs (without ID) operate on multiple resources
-    - Use appropriate HTTP methods for different operations
+    if category_filter:
+        logger.debug("🔍 Filtered by category '%s': %d items", category_filter, total)
+    
+    # The whole list is serialized in one _body() call
+    return {
+        'statusCode': 200,
+        'headers': CORS_HEADERS,
+        'body': _body({
+            'items': filtered_items,
+            'total': total,
+            'filter': category_filter,
+            'message': f'Retrieved {total} items'
+        })
+    }
+
+def handle_create_item(event):
     """
+    POST /items - Create New Item
+    ============================
     
-    if http_method == 'GET':
-        # ======================================================================
-        # GET /items - Retrieve All Items
-        # ======================================================================
-        # Optional query parameter filtering: /items?category=electronics
-        query_params = event.get('queryStringParameters') or {}
-        category_filter = query_params.get('category')
+    Requires a JSON body with at least a 'name'. Returns 201 with the
+    stored item.
+    """
+    try:
+        # Parse JSON body from request
+        # API Gateway provides body as string, we need to parse it
+        body = _loads(event.get('body') or '{}')
+        logger.debug("📥 Creating item with data: %s", body)
         
-        # Start with all items from storage
-        filtered_items = list(items_storage.values())
+        # ==========================================
+        # INPUT VALIDATION
+        # ==========================================
+        # Validate required fields before processing. Valid JSON can still
+        # be a list, string or number - reject it here rather than fail on
+        # it later with a 500
+        if not isinstance(body, dict):
+            return BODY_NOT_OBJECT_RESPONSE
         
-        # Apply category filter if provided
-        if category_filter:
-            filtered_items = [
-                item for item in filtered_items 
-                if item.get('category') == category_filter
-            ]
-            print(f"🔍 Filtered by category '{category_filter}': {len(filtered_items)} items")
+        name = body.get('name')
+        if not name:
+            return NAME_REQUIRED_RESPONSE
+        
+        # Category is an index key (in memory and in DynamoDB) - must be a
+        # non-empty string
+        category = body.get('category', 'general')  # Default category
+        if not isinstance(category, str):
+            return CATEGORY_NOT_STRING_RESPONSE
+        if not category:
+            return CATEGORY_EMPTY_RESPONSE
+        
+        # ==========================================
+        # ITEM CREATION
+        # ==========================================
+        # Generate unique ID for the new item
+        item_id = token_hex(16)  # 128 random bits, e.g. "3f2b8c1e9a4d4e6f8b0c7d2e1f3a5b6c"
+        
+        # One UTC timestamp for both fields (UTC also skips the local
+        # timezone lookup)
+        now = datetime.now(timezone.utc).isoformat()
+        
+        # Create item object with all fields
+        new_item = Item(
+            id=item_id,
+            name=name,
+            description=body.get('description', ''),  # Optional field
+            category=category,
+            price=body.get('price', 0),               # Default price
+            created_at=now,                           # ISO timestamp
+            updated_at=now                            # Same as created for new items
+        )
+        
+        # Save to DynamoDB (or memory when no table is configured)
+        put_item(new_item)
+        
+        logger.debug("✅ Created item with ID: %s", item_id)
         
         return {
-            'statusCode': 200,
-            'headers': cors_headers,
-            'body': json.dumps({
-                'items': filtered_items,
-                'total': len(filtered_items),
-                'filter': category_filter,
-                'message': f'Retrieved {len(filtered_items)} items'
-            })
-        }
-    
-    elif http_method == 'POST':
-        # ======================================================================
-        # POST /items - Create New Item
-        # ======================================================================
-        try:
-            # Parse JSON body from request
-            # API Gateway provides body as string, we need to parse it
-            body = json.loads(event.get('body', '{}'))
-            print(f"📥 Creating item with data: {body}")
-            
-            # ==========================================
-            # INPUT VALIDATION
-            # ==========================================
-            # Validate required fields before processing
-            if not body.get('name'):
-                return {
-                    'statusCode': 400,  # Bad Request
-                    'headers': cors_headers,
-                    'body': json.dumps({
-                        'error': 'Name is required',
-                        'field': 'name'
-                    })
-                }
-            
-            # ==========================================
-            # ITEM CREATION
-            # ==========================================
-            # Generate unique ID for the new item
-            item_id = str(uuid.uuid4())  # e.g., "123e4567-e89b-12d3-a456-426614174000"
-            
-            # Create item object with all fields
-            new_item = {
-                'id': item_id,
-                'name': body['name'],
-                'description': body.get('description', ''),  # Optional field
-                'category': body.get('category', 'general'), # Default category
-                'price': body.get('price', 0),               # Default price
-                'created_at': datetime.now().isoformat(),    # ISO timestamp
-                'updated_at': datetime.now().isoformat()     # Same as created for new items
-            }
-            
-            # Store in memory (in production: save to DynamoDB)
-            items_storage[item_id] = new_item
-            
-            print(f"✅ Created item with ID: {item_id}")
-            
-            return {
-                'statusCode': 201,  # Created
-                'headers': cors_headers,
-                'body': json.dumps({
-                    'item': new_item,
-                    'message': 'Item created successfully'
-                })
-            }
-            
-        except json.JSONDecodeError:
-            # Handle invalid JSON in request body
-            return {
-                'statusCode': 400,  # Bad Request
-                'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'Invalid JSON in request body',
-                    'tip': 'Ensure request Content-Type is application/json'
-                })
-            }
-    
-    else:
-        # Method not allowed for this endpoint
-        return {
-            'statusCode': 405,  # Method Not Allowed
-            'headers': cors_headers,
-            'body': json.dumps({
-                'error': f'Method {http_method} not allowed for /items',
-                'allowed_methods': ['GET', 'POST']
+            'statusCode': 201,  # Created
+            'headers': CORS_HEADERS,
+            'body': _body({
+                'item': new_item,
+                'message': 'Item created successfully'
             })
         }
+        
+    except JSONDecodeError:
+        # Handle invalid JSON in request body
+        return INVALID_JSON_RESPONSE
 
-def handle_single_item(event, http_method, item_id, cors_headers):
+# ==============================================================================
+# SINGLE ITEM HANDLERS
+# ==============================================================================
+# Operations on individual items. REST Conventions:
+# - Resource URLs (with ID) operate on single resources
+# - PUT for complete resource updates
+# - DELETE for resource removal
+
+def handle_get_item(event, item_id):
+    """
+    GET /items/{id} - Retrieve Single Item
+    =====================================
     """
-    Single Item Handler
-    ==================
+    item = get_item(item_id)
+    if item is None:
+        return ITEM_NOT_FOUND_RESPONSE
     
-    Handles operations on individual items:
-    - GET /items/{id}: Retrieve specific item
-    - PUT /items/{id}: Update specific item
-    - DELETE /items/{id}: Delete specific item
+    logger.debug("📖 Retrieved item: %s", item_id)
     
-    REST Conventions:
-    - Resource URLs (with ID) operate on single resources
-    - PUT for complete resource updates
-    - DELETE for resource removal
+    return {
+        'statusCode': 200,
+        'headers': CORS_HEADERS,
+        'body': _body({
+            'item': item,
+            'message': 'Item retrieved successfully'
+        })
+    }
+
+def handle_update_item(event, item_id):
     """
+    PUT /items/{id} - Update Item
+    ============================
     
-    if http_method == 'GET':
-        # ======================================================================
-        # GET /items/{id} - Retrieve Single Item
-        # ======================================================================
-        if item_id not in items_storage:
-            return {
-                'statusCode': 404,  # Not Found
-                'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'Item not found',
-                    'item_id': item_id
-                })
-            }
+    Fields missing from the body keep their existing values.
+    """
+    try:
+        body = _loads(event.get('body') or '{}')
+        logger.debug("📝 Updating item %s with: %s", item_id, body)
+        
+        if not isinstance(body, dict):
+            return BODY_NOT_OBJECT_RESPONSE
+        if 'category' in body:
+            if not isinstance(body['category'], str):
+                return CATEGORY_NOT_STRING_RESPONSE
+            if not body['category']:
+                return CATEGORY_EMPTY_RESPONSE
         
-        item = items_storage[item_id]
-        print(f"📖 Retrieved item: {item_id}")
+        # ==========================================
+        # UPDATE LOGIC
+        # ==========================================
+        now = datetime.now(timezone.utc).isoformat()
+        
+        # Update only the fields provided (keeping existing values otherwise)
+        # and always the timestamp. The existence check is part of the write
+        changes = {field: body[field] for field in MUTABLE_FIELDS if field in body}
+        existing_item = update_item(item_id, changes, now)
+        if existing_item is None:
+            return ITEM_NOT_FOUND_RESPONSE
+        
+        logger.debug("✅ Updated item: %s", item_id)
         
         return {
             'statusCode': 200,
-            'headers': cors_headers,
-            'body': json.dumps({
-                'item': item,
-                'message': 'Item retrieved successfully'
+            'headers': CORS_HEADERS,
+            'body': _body({
+                'item': existing_item,
+                'message': 'Item updated successfully'
             })
         }
+        
+    except JSONDecodeError:
+        return INVALID_JSON_RESPONSE
+
+def handle_delete_item(event, item_id):
+    """
+    DELETE /items/{id} - Delete Item
+    ===============================
     
-    elif http_method == 'PUT':
-        # ======================================================================
-        # PUT /items/{id} - Update Item
-        # ======================================================================
-        try:
-            body = json.loads(event.get('body', '{}'))
-            print(f"📝 Updating item {item_id} with: {body}")
-            
-            # Check if item exists
-            if item_id not in items_storage:
-                return {
-                    'statusCode': 404,
-                    'headers': cors_headers,
-                    'body': json.dumps({
-                        'error': 'Item not found',
-                        'item_id': item_id
-                    })
-                }
-            
-            # ==========================================
-            # UPDATE LOGIC
-            # ==========================================
-            # Get existing item and update fields
-            existing_item = items_storage[item_id]
-            
-            # Update fields (keeping existing values if not provided)
-            existing_item.update({
-                'name': body.get('name', existing_item['name']),
-                'description': body.get('description', existing_item['description']),
-                'category': body.get('category', existing_item['category']),
-                'price': body.get('price', existing_item['price']),
-                'updated_at': datetime.now().isoformat()  # Always update timestamp
-            })
-            
-            print(f"✅ Updated item: {item_id}")
-            
-            return {
-                'statusCode': 200,
-                'headers': cors_headers,
-                'body': json.dumps({
-                    'item': existing_item,
-                    'message': 'Item updated successfully'
-                })
-            }
-            
-        except json.JSONDecodeError:
-            return {
-                'statusCode': 400,
-                'headers': cors_headers,
-                'body': json.dumps({'error': 'Invalid JSON in request body'})
-            }
+    Returns the deleted item.
+    """
+    # Remove item from storage and return the deleted item
+    deleted_item = delete_item(item_id)
+    if deleted_item is None:
+        return ITEM_NOT_FOUND_RESPONSE
     
-    elif http_method == 'DELETE':
-        # ======================================================================
-        # DELETE /items/{id} - Delete Item
-        # ======================================================================
-        if item_id not in items_storage:
-            return {
-                'statusCode': 404,
-                'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'Item not found',
-                    'item_id': item_id
-                })
-            }
-        
-        # Remove item from storage and return the deleted item
-        deleted_item = items_storage.pop(item_id)
-        print(f"🗑️ Deleted item: {item_id}")
-        
-        return {
-            'statusCode': 200,  # Some APIs use 204 No Content
-            'headers': cors_headers,
-            'body': json.dumps({
-                'item': deleted_item,
-                'message': 'Item deleted successfully'
-            })
-        }
+    logger.debug("🗑️ Deleted item: %s", item_id)
     
-    else:
-        # Method not allowed for this endpoint
-        return {
-            'statusCode': 405,
-            'headers': cors_headers,
-            'body': json.dumps({
-                'error': f'Method {http_method} not allowed for /items/{item_id}',
-                'allowed_methods': ['GET', 'PUT', 'DELETE']
-            })
-        }
+    return {
+        'statusCode': 200,  # Some APIs use 204 No Content
+        'headers': CORS_HEADERS,
+        'body': _body({
+            'item': deleted_item,
+            'message': 'Item deleted successfully'
+        })
+    }
+
+# ==============================================================================
+# ROUTE TABLES (built once per container, at cold start)
+# ==============================================================================
+# Exact (method, path) matches → handler(event)
+ROUTES = {
+    ('GET', '/health'): handle_health,
+    ('GET', '/items'): handle_list_items,
+    ('POST', '/items'): handle_create_item,
+}
+
+# /items/{id} routes, keyed by method → handler(event, item_id)
+ITEM_ROUTES = {
+    'GET': handle_get_item,
+    'PUT': handle_update_item,
+    'DELETE': handle_delete_item,
+}
+
+# HTTP API (payload format 2.0) route keys → handler(event)
+HTTP_API_ROUTES = {
+    'GET /health': handle_health,
+    'GET /items': handle_list_items,
+    'POST /items': handle_create_item,
+}
+
+# HTTP API /items/{id} route keys → handler(event, item_id)
+HTTP_API_ITEM_ROUTES = {
+    'GET /items/{id}': handle_get_item,
+    'PUT /items/{id}': handle_update_item,
+    'DELETE /items/{id}': handle_delete_item,
+}
+
+# Paths that exist but were called with an unsupported method
+METHOD_NOT_ALLOWED_BODIES = {
+    '/health': HEALTH_METHOD_NOT_ALLOWED_BODY,
+    '/items': ITEMS_METHOD_NOT_ALLOWED_BODY,
+}
 
 # ==============================================================================
 # LAMBDA EXECUTION CONTEXT
@@ -429,6 +810,15 @@ Lambda Execution Model:
    - Executes global code (imports, global variables)
    - Calls lambda_handler()
    
+   Everything that doesn't depend on the request is done in global code so
+   it runs once per container: imports, env-var parsing, the DynamoDB table
+   handle, CORS headers, pre-serialized responses and the route tables.
+   lambda_handler() only routes and runs business logic.
+   
+   With SnapStart (Python 3.12+) AWS snapshots memory after global code has
+   run and restores new containers from it, skipping init almost entirely.
+   Provisioned concurrency keeps initialized containers warm instead.
+   
 2. WARM START: Subsequent invocations
    - Reuses existing container
    - Global variables persist (like items_storage)
@@ -455,7 +845,8 @@ Cost Model:
 - Very cost-effective for variable workloads
 
 Monitoring:
-- All print() statements go to CloudWatch Logs
+- Logger output goes to CloudWatch Logs; set LOG_LEVEL=DEBUG to see
+  per-request messages (they're skipped at the default WARNING level)
 - Automatic metrics: invocations, duration, errors
 - X-Ray tracing available for debugging
 """
\ No newline at end of file